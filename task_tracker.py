@@ -1,215 +1,322 @@
 import streamlit as st
+import pandas as pd
 import sqlite3
-from datetime import datetime, timedelta
+import queue
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.background import BackgroundScheduler
-import threading
-import time
-import os
+
+# Desktop notifications are optional (pip install plyer)
+try:
+    from plyer import notification as _notif
+except ImportError:
+    _notif = None
+
+DB_PATH = 'tasks.db'
+POOL_SIZE = 4
+# Prepared statements kept per connection by the sqlite3 module
+STATEMENT_CACHE_SIZE = 256
+
+# Applied to every new connection; these settings do not persist in the database file
+CONNECTION_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",  # wait for the writer instead of failing with "database is locked"
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+
+# Reminders that fire late (e.g. the process was suspended) still run within this window
+REMINDER_MISFIRE_GRACE = 24 * 60 * 60
+
+# init_db() migrates older databases, so every query can rely on the full schema
+SELECT_TASKS_SQL = 'SELECT id, title, deadline, problems, requirements, priority, status, created_at FROM tasks'
+_ORDER_BY = {
+    'deadline': ' ORDER BY deadline ASC',
+    'priority': ' ORDER BY CASE priority WHEN "High" THEN 1 WHEN "Medium" THEN 2 WHEN "Low" THEN 3 END',
+    'created': ' ORDER BY created_at DESC',
+}
+# One fixed statement per (sort_by, filtered) so the statement cache can reuse the prepared query
+TASK_QUERIES = {
+    (sort_by, filtered): SELECT_TASKS_SQL + (' WHERE status = ?' if filtered else '') + order_by
+    for sort_by, order_by in _ORDER_BY.items()
+    for filtered in (False, True)
+}
+DUE_SOON_SQL = '''SELECT id, title, deadline, problems, requirements, priority, status,
+                         CAST(julianday(deadline) - julianday(:today) AS INTEGER) AS days_until
+                  FROM tasks
+                  WHERE status != 'Completed' AND deadline BETWEEN :today AND date(:today, '+1 day')
+                  ORDER BY deadline'''
+INSERT_TASK_SQL = '''INSERT INTO tasks (title, deadline, problems, requirements, priority, status, created_at)
+                     VALUES (?, ?, ?, ?, ?, ?, ?)'''
+
+# Open a connection with per-connection pragmas applied
+def _connect():
+    # Pooled connections are shared by the UI and scheduler threads and run in autocommit mode
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None,
+                           cached_statements=STATEMENT_CACHE_SIZE)
+    conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+# Connection pool shared across reruns, sessions and the scheduler thread
+@st.cache_resource
+def get_pool():
+    pool = queue.Queue()
+    for _ in range(POOL_SIZE):
+        pool.put(_connect())
+    return pool
+
+# Borrow a pooled connection for the duration of a block
+@contextmanager
+def _pooled():
+    pool = get_pool()
+    conn = pool.get()
+    try:
+        yield conn
+    finally:
+        pool.put(conn)
+
+# Write counter shared by every session; cached task queries are keyed on it
+@st.cache_resource
+def _tasks_version():
+    return {'value': 0}
+
+def _bump_tasks_version():
+    _tasks_version()['value'] += 1
+
+# Run a block of writes as one transaction, committed (and cache-invalidated) once
+@contextmanager
+def tx():
+    with _pooled() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    _bump_tasks_version()
 
 # Database setup with migration support
 def init_db():
-    conn = sqlite3.connect('tasks.db')
-    c = conn.cursor()
-    
-    # Create table if it doesn't exist
-    c.execute('''CREATE TABLE IF NOT EXISTS tasks (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        title TEXT NOT NULL,
-        deadline TEXT NOT NULL,
-        problems TEXT,
-        requirements TEXT,
-        priority TEXT DEFAULT 'Medium',
-        status TEXT DEFAULT 'Pending',
-        created_at TEXT DEFAULT CURRENT_TIMESTAMP
-    )''')
-    
-    # Check if new columns exist and add them if they don't
-    c.execute("PRAGMA table_info(tasks)")
-    columns = [column[1] for column in c.fetchall()]
-    
-    if 'priority' not in columns:
-        c.execute('ALTER TABLE tasks ADD COLUMN priority TEXT DEFAULT "Medium"')
-        print("Added priority column")
-    
-    if 'status' not in columns:
-        c.execute('ALTER TABLE tasks ADD COLUMN status TEXT DEFAULT "Pending"')
-        print("Added status column")
-    
-    if 'created_at' not in columns:
-        c.execute('ALTER TABLE tasks ADD COLUMN created_at TEXT')
-        # Update existing rows with current timestamp
-        c.execute('UPDATE tasks SET created_at = datetime("now") WHERE created_at IS NULL')
-        print("Added created_at column")
-    
-    conn.commit()
-    conn.close()
+    with _pooled() as conn:
+        # WAL lets the UI read while the scheduler writes; journal_mode persists in the database file
+        conn.execute("PRAGMA journal_mode=WAL")
+        
+        # Create table if it doesn't exist
+        conn.execute('''CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            deadline TEXT NOT NULL,
+            problems TEXT,
+            requirements TEXT,
+            priority TEXT DEFAULT 'Medium',
+            status TEXT DEFAULT 'Pending',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )''')
+        
+        # Check if new columns exist and add them if they don't
+        columns = [column[1] for column in conn.execute("PRAGMA table_info(tasks)").fetchall()]
+        
+        if 'priority' not in columns:
+            conn.execute('ALTER TABLE tasks ADD COLUMN priority TEXT DEFAULT "Medium"')
+            print("Added priority column")
+        
+        if 'status' not in columns:
+            conn.execute('ALTER TABLE tasks ADD COLUMN status TEXT DEFAULT "Pending"')
+            print("Added status column")
+        
+        if 'created_at' not in columns:
+            conn.execute('ALTER TABLE tasks ADD COLUMN created_at TEXT')
+            # Update existing rows with current timestamp
+            conn.execute('UPDATE tasks SET created_at = datetime("now") WHERE created_at IS NULL')
+            print("Added created_at column")
+        
+        # Indexes for the status counts and the due-soon range scan
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_tasks_status_deadline ON tasks(status, deadline)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_tasks_deadline ON tasks(deadline)')
 
 # Add a new task
 def add_task(title, deadline, problems, requirements, priority='Medium'):
-    conn = sqlite3.connect('tasks.db')
-    c = conn.cursor()
-    
-    # Check if new columns exist
-    c.execute("PRAGMA table_info(tasks)")
-    columns = [column[1] for column in c.fetchall()]
+    with tx() as conn:
+        cur = conn.execute(INSERT_TASK_SQL,
+                           (title, deadline, problems, requirements, priority, 'Pending', datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
     
-    if 'priority' in columns and 'status' in columns and 'created_at' in columns:
-        # New schema with all columns
-        c.execute('''INSERT INTO tasks (title, deadline, problems, requirements, priority, status, created_at) 
-                     VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                  (title, deadline, problems, requirements, priority, 'Pending', datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
-    else:
-        # Old schema - just basic columns
-        c.execute('INSERT INTO tasks (title, deadline, problems, requirements) VALUES (?, ?, ?, ?)',
-                  (title, deadline, problems, requirements))
+    # The task is saved at this point; a scheduler problem must not fail the write
+    try:
+        schedule_reminder(cur.lastrowid, deadline)
+    except Exception as e:
+        print(f"❌ Failed to schedule reminder for task {cur.lastrowid}: {e}")
+
+# Get all tasks with optional filtering
+@st.cache_data(show_spinner=False, max_entries=32)
+def _get_tasks_cached(version, status_filter, sort_by):
+    query = TASK_QUERIES[(sort_by, bool(status_filter))]
+    params = (status_filter,) if status_filter else ()
     
-    conn.commit()
-    conn.close()
+    with _pooled() as conn:
+        # Plain dicts so the result can be pickled into the cache
+        return [dict(row) for row in conn.execute(query, params).fetchall()]
 
-# Get all tasks with optional filtering and safe column handling
+# Reruns reuse the cached result until the next write bumps the version
 def get_tasks(status_filter=None, sort_by='deadline'):
-    conn = sqlite3.connect('tasks.db')
-    c = conn.cursor()
-    
-    # Get column information to handle different database schemas
-    c.execute("PRAGMA table_info(tasks)")
-    columns = [column[1] for column in c.fetchall()]
-    
-    # Build query based on available columns
-    query = 'SELECT id, title, deadline, problems, requirements'
-    
-    # Add optional columns if they exist
-    if 'priority' in columns:
-        query += ', priority'
-    else:
-        query += ', "Medium" as priority'
-    
-    if 'status' in columns:
-        query += ', status'
-    else:
-        query += ', "Pending" as status'
-    
-    if 'created_at' in columns:
-        query += ', created_at'
-    else:
-        query += ', datetime("now") as created_at'
-    
-    query += ' FROM tasks'
-    
-    params = []
+    return _get_tasks_cached(_tasks_version()['value'], status_filter, sort_by)
+
+# Apply status changes ({task_id: status}) and deletions in one transaction
+def apply_task_edits(status_changes, deleted_ids):
+    with tx() as conn:
+        conn.executemany('UPDATE tasks SET status = ? WHERE id = ?',
+                         [(status, task_id) for task_id, status in status_changes.items()])
+        conn.executemany('DELETE FROM tasks WHERE id=?', [(task_id,) for task_id in deleted_ids])
     
-    if status_filter and 'status' in columns:
-        query += ' WHERE status = ?'
-        params.append(status_filter)
+    for task_id in deleted_ids:
+        try:
+            get_scheduler().remove_job(f'task_{task_id}', jobstore='default')
+        except JobLookupError:
+            pass
+        except Exception as e:
+            print(f"❌ Failed to remove reminder for task {task_id}: {e}")
+
+# data_editor on_change callback: save this session's table edits in one transaction.
+# It runs before the rerun, so row positions still match the task_ids that were rendered.
+def _save_task_edits(editor_key, task_ids):
+    status_changes = {}
+    deleted_ids = []
+    for pos, changes in st.session_state[editor_key]['edited_rows'].items():
+        task_id = task_ids[int(pos)]
+        if changes.get('delete'):
+            deleted_ids.append(task_id)
+        elif 'status' in changes:
+            status_changes[task_id] = changes['status']
     
-    if sort_by == 'deadline':
-        query += ' ORDER BY deadline ASC'
-    elif sort_by == 'priority' and 'priority' in columns:
-        query += ' ORDER BY CASE priority WHEN "High" THEN 1 WHEN "Medium" THEN 2 WHEN "Low" THEN 3 END'
-    elif sort_by == 'created' and 'created_at' in columns:
-        query += ' ORDER BY created_at DESC'
+    if status_changes or deleted_ids:
+        apply_task_edits(status_changes, deleted_ids)
+        # New key so the editor starts clean; only this session's saves bump it
+        st.session_state['task_editor_resets'] += 1
+
+# Task counts and due-soon list for the dashboard
+@dataclass
+class TaskSummary:
+    pending: int = 0
+    completed: int = 0
+    due_list: list = field(default_factory=list)
+
+    @property
+    def due_soon(self):
+        return len(self.due_list)
+
+# Get a single task by id
+def get_task(task_id):
+    with _pooled() as conn:
+        row = conn.execute(SELECT_TASKS_SQL + ' WHERE id = ?', (task_id,)).fetchone()
+    return dict(row) if row else None
+
+# Count tasks per status with one aggregate query
+def counts_by_status():
+    with _pooled() as conn:
+        return dict(conn.execute('SELECT status, COUNT(*) FROM tasks GROUP BY status').fetchall())
+
+# Get open tasks due today or tomorrow, filtered by SQLite on the deadline index
+def get_due_soon_tasks(today=None):
+    today = today or datetime.now().date().isoformat()
+    with _pooled() as conn:
+        rows = conn.execute(DUE_SOON_SQL, {'today': today}).fetchall()
+    return [dict(row) for row in rows]
+
+# Dashboard figures, cached until the next write or the next day
+@st.cache_data(show_spinner=False, max_entries=32)
+def _summary_cached(version, today):
+    counts = counts_by_status()
+    return {
+        'pending': counts.get('Pending', 0),
+        'completed': counts.get('Completed', 0),
+        'due_list': get_due_soon_tasks(today),
+    }
+
+def summarize():
+    today = datetime.now().date().isoformat()
+    return TaskSummary(**_summary_cached(_tasks_version()['value'], today))
+
+# Notify about a single task due today (0) or tomorrow (1)
+def _notify(task, days_until):
+    title, deadline = task['title'], task['deadline']
+    priority, problems = task['priority'], task['problems']
     
-    c.execute(query, params)
-    tasks = c.fetchall()
-    conn.close()
-    return tasks
-
-# Update task status
-def update_task_status(task_id, status):
-    conn = sqlite3.connect('tasks.db')
-    c = conn.cursor()
-    c.execute('UPDATE tasks SET status = ? WHERE id = ?', (status, task_id))
-    conn.commit()
-    conn.close()
-
-# Delete a task
-def delete_task(task_id):
-    conn = sqlite3.connect('tasks.db')
-    c = conn.cursor()
-    c.execute('DELETE FROM tasks WHERE id=?', (task_id,))
-    conn.commit()
-    conn.close()
-
-# Get tasks due soon with safe column handling
-def get_due_soon_tasks():
-    tasks = get_tasks()
-    now = datetime.now()
-    due_soon = []
+    urgency = "TODAY" if days_until == 0 else "TOMORROW"
     
-    for task in tasks:
-        # Handle different tuple lengths safely
-        if len(task) < 7:
-            continue
-            
-        task_id, title, deadline, problems, requirements, priority, status = task[:7]
-        created_at = task[7] if len(task) > 7 else None
-        
-        if status == 'Completed':
-            continue
-            
-        try:
-            deadline_dt = datetime.strptime(deadline, '%Y-%m-%d')
-            days_until = (deadline_dt - now).days
-            
-            if days_until <= 1 and days_until >= 0:
-                due_soon.append((task, days_until))
-        except ValueError:
-            continue
+    # Desktop notification (only if plyer is installed)
+    if _notif is not None:
+        _notif.notify(
+            title=f"⚠️ Task Due {urgency}",
+            message=f"{title}\nDue: {deadline}\nPriority: {priority}",
+            timeout=15
+        )
     
-    return due_soon
+    # Console notification (always works)
+    print(f"🔔 REMINDER: Task '{title}' is due {urgency} ({deadline})!")
+    print(f"   Priority: {priority}")
+    if problems:
+        print(f"   Problems: {problems}")
+    print("-" * 50)
 
 # Enhanced reminder function
 def send_reminders():
-    due_soon = get_due_soon_tasks()
+    for task in get_due_soon_tasks():
+        _notify(task, task['days_until'])
+
+# One-shot reminder job for a single task
+def notify_one(task_id):
+    task = get_task(task_id)
+    if task is None or task['status'] == 'Completed':
+        return
     
-    for task_info, days_until in due_soon:
-        # Handle different tuple lengths safely
-        task_id, title, deadline, problems, requirements = task_info[:5]
-        priority = task_info[5] if len(task_info) > 5 else 'Medium'
-        status = task_info[6] if len(task_info) > 6 else 'Pending'
-        created_at = task_info[7] if len(task_info) > 7 else None
-        
-        urgency = "TODAY" if days_until == 0 else "TOMORROW"
-        
-        # Try desktop notification (will work if plyer is installed)
-        try:
-            from plyer import notification
-            notification.notify(
-                title=f"⚠️ Task Due {urgency}",
-                message=f"{title}\nDue: {deadline}\nPriority: {priority}",
-                timeout=15
-            )
-        except ImportError:
-            pass
-        
-        # Console notification (always works)
-        print(f"🔔 REMINDER: Task '{title}' is due {urgency} ({deadline})!")
-        print(f"   Priority: {priority}")
-        if problems:
-            print(f"   Problems: {problems}")
-        print("-" * 50)
-
-# Scheduler setup with error handling
-def start_scheduler():
-    try:
-        scheduler = BackgroundScheduler()
-        scheduler.add_job(send_reminders, 'interval', hours=6)  # Check every 6 hours
-        scheduler.start()
-        print("✅ Reminder scheduler started successfully")
-    except Exception as e:
-        print(f"❌ Failed to start scheduler: {e}")
+    days_until = (date.fromisoformat(task['deadline']) - date.today()).days
+    if 0 <= days_until <= 1:
+        _notify(task, days_until)
 
-# Ensure scheduler runs only once per session
-if 'scheduler_started' not in st.session_state:
+# Schedule a reminder for the day before the deadline (or right away if that has passed)
+def schedule_reminder(task_id, deadline, scheduler=None):
     try:
-        threading.Thread(target=start_scheduler, daemon=True).start()
-        st.session_state['scheduler_started'] = True
-    except Exception as e:
-        st.error(f"Failed to start background scheduler: {e}")
+        deadline_dt = datetime.fromisoformat(deadline)
+    except ValueError:
+        print(f"⚠️ Skipping reminder for task {task_id}: invalid deadline {deadline!r}")
+        return
+    
+    now = datetime.now()
+    if deadline_dt.date() < now.date():
+        return
+    
+    (scheduler or get_scheduler()).add_job(notify_one, 'date', run_date=max(deadline_dt - timedelta(days=1), now),
+                                           args=[task_id], id=f'task_{task_id}', replace_existing=True)
+
+# Scheduler shared by every session; BackgroundScheduler runs its own thread
+@st.cache_resource
+def get_scheduler():
+    scheduler = BackgroundScheduler(job_defaults={'misfire_grace_time': REMINDER_MISFIRE_GRACE, 'coalesce': True})
+    
+    # Catch up on tasks already due, then add one reminder per later deadline
+    scheduler.add_job(send_reminders)
+    tomorrow_str = (date.today() + timedelta(days=1)).isoformat()
+    for task in get_tasks():
+        if task['status'] != 'Completed' and task['deadline'] > tomorrow_str:
+            schedule_reminder(task['id'], task['deadline'], scheduler)
+    
+    scheduler.start()
+    print("✅ Reminder scheduler started successfully")
+    return scheduler
 
 # Initialize DB
 init_db()
 
+# Start the scheduler once per process; st.cache_resource makes later calls a lookup
+try:
+    get_scheduler()
+except Exception as e:
+    st.error(f"Failed to start background scheduler: {e}")
+
 # Streamlit App
 st.set_page_config(page_title="Task Tracker", page_icon="📋", layout="wide")
 
@@ -219,11 +326,11 @@ st.markdown("*Stay organized and never miss a deadline!*")
 # Sidebar for filters and stats
 st.sidebar.header("📊 Dashboard")
 
-# Task statistics with safe indexing
-all_tasks = get_tasks()
-pending_tasks = len([t for t in all_tasks if len(t) > 6 and t[6] == 'Pending'])
-completed_tasks = len([t for t in all_tasks if len(t) > 6 and t[6] == 'Completed'])
-due_soon = len(get_due_soon_tasks())
+# Task statistics
+summary = summarize()
+pending_tasks = summary.pending
+completed_tasks = summary.completed
+due_soon = summary.due_soon
 
 col1, col2, col3 = st.sidebar.columns(3)
 with col1:
@@ -278,82 +385,64 @@ with col2:
     if not tasks:
         st.info("No tasks found. Add your first task to get started!")
     else:
+        # Deadlines are stored as YYYY-MM-DD, so plain string comparison orders them by date
+        today = datetime.now().date()
+        today_str = today.isoformat()
+        tomorrow_str = (today + timedelta(days=1)).isoformat()
+        
+        rows = []
         for task in tasks:
-            # Handle different tuple lengths safely
-            task_id, title, deadline, problems, requirements = task[:5]
-            priority = task[5] if len(task) > 5 else 'Medium'
-            status = task[6] if len(task) > 6 else 'Pending'
-            created_at = task[7] if len(task) > 7 else None
+            deadline, status = task['deadline'], task['status']
             
             # Determine if task is overdue
-            try:
-                deadline_dt = datetime.strptime(deadline, '%Y-%m-%d')
-                days_until = (deadline_dt - datetime.now()).days
-                is_overdue = days_until < 0 and status != 'Completed'
-                is_due_soon = 0 <= days_until <= 1 and status != 'Completed'
-            except ValueError:
-                is_overdue = False
-                is_due_soon = False
+            is_open = status != 'Completed'
+            is_overdue = is_open and deadline < today_str
+            is_due_soon = is_open and today_str <= deadline <= tomorrow_str
             
-            # Task container with color coding
+            # Status marker column replaces the per-task colour coding
             if is_overdue:
-                container_type = "error"
                 status_emoji = "🚨"
             elif is_due_soon:
-                container_type = "warning"
                 status_emoji = "⚠️"
             elif status == 'Completed':
-                container_type = "success"
                 status_emoji = "✅"
             else:
-                container_type = "info"
                 status_emoji = "📋"
             
-            with st.container():
-                st.markdown(f"### {status_emoji} {title}")
-                
-                # Task details in columns
-                detail_col1, detail_col2, detail_col3 = st.columns([2, 1, 1])
-                
-                with detail_col1:
-                    st.markdown(f"**Due:** {deadline}")
-                    if problems:
-                        st.markdown(f"**Problems:** {problems}")
-                    if requirements:
-                        st.markdown(f"**Requirements:** {requirements}")
-                
-                with detail_col2:
-                    st.markdown(f"**Priority:** {priority}")
-                    st.markdown(f"**Status:** {status}")
-                
-                with detail_col3:
-                    # Status update buttons
-                    if status != 'Completed':
-                        if st.button('Mark Complete', key=f'complete_{task_id}', type="primary"):
-                            update_task_status(task_id, 'Completed')
-                            st.rerun()
-                        
-                        if status != 'In Progress':
-                            if st.button('Start Working', key=f'progress_{task_id}'):
-                                update_task_status(task_id, 'In Progress')
-                                st.rerun()
-                    else:
-                        if st.button('Mark Pending', key=f'pending_{task_id}'):
-                            update_task_status(task_id, 'Pending')
-                            st.rerun()
-                    
-                    # Delete button
-                    if st.button('🗑️ Delete', key=f'delete_{task_id}', help="Delete this task"):
-                        delete_task(task_id)
-                        st.rerun()
-                
-                st.markdown("---")
+            rows.append({**task, 'marker': status_emoji, 'delete': False})
+        
+        # One Arrow-encoded table instead of a block of widgets per task
+        df = pd.DataFrame(rows, columns=['id', 'marker', 'title', 'deadline', 'priority', 'status',
+                                         'problems', 'requirements', 'delete']).set_index('id')
+        editor_key = f"task_editor_{st.session_state.setdefault('task_editor_resets', 0)}"
+        st.data_editor(
+            df,
+            key=editor_key,
+            on_change=_save_task_edits,
+            args=(editor_key, [int(task_id) for task_id in df.index]),
+            hide_index=True,
+            num_rows="fixed",
+            use_container_width=True,
+            disabled=['marker', 'title', 'deadline', 'priority', 'problems', 'requirements'],
+            column_config={
+                'marker': st.column_config.TextColumn("", width="small"),
+                'title': st.column_config.TextColumn("Task"),
+                'deadline': st.column_config.TextColumn("Due"),
+                'priority': st.column_config.TextColumn("Priority"),
+                'status': st.column_config.SelectboxColumn(
+                    "Status", options=['Pending', 'In Progress', 'Completed'], required=True
+                ),
+                'problems': st.column_config.TextColumn("Problems"),
+                'requirements': st.column_config.TextColumn("Requirements"),
+                'delete': st.column_config.CheckboxColumn("🗑️ Delete", help="Delete this task"),
+            },
+        )
 
 # Footer with tips
 st.markdown("---")
 st.markdown("### 💡 Tips")
 st.markdown("""
-- **Reminders**: The app checks for due tasks every 6 hours and sends notifications
+- **Reminders**: The app sends a notification the day before each task's deadline
 - **Desktop Notifications**: Install `plyer` package for desktop notifications: `pip install plyer`
 - **Priority Levels**: Use High for urgent tasks, Medium for important ones, Low for nice-to-have
 - **Status Tracking**: Move tasks through Pending → In Progress → Completed
@@ -362,11 +451,8 @@ st.markdown("""
 # Show upcoming deadlines
 if due_soon > 0:
     st.warning(f"⚠️ You have {due_soon} task(s) due soon!")
-    due_tasks = get_due_soon_tasks()
-    for task_info, days_until in due_tasks:
-        # Handle different tuple lengths safely
-        task_id, title, deadline, problems, requirements = task_info[:5]
-        priority = task_info[5] if len(task_info) > 5 else 'Medium'
-        status = task_info[6] if len(task_info) > 6 else 'Pending'
+    for task_info in summary.due_list:
+        title, deadline, priority = task_info['title'], task_info['deadline'], task_info['priority']
+        days_until = task_info['days_until']
         urgency = "today" if days_until == 0 else "tomorrow"
         st.markdown(f"- **{title}** is due {urgency} ({deadline}) - Priority: {priority}")
\ No newline at end of file